@@ -1,3 +1,5 @@
+from collections import OrderedDict
+from collections.abc import Collection, Iterable
 from typing import Any
 
 from anyio import Event
@@ -7,50 +9,86 @@ from .poller import Poller, PollingResult, PollingStatus, ProblemDetails
 __all__ = ("DefaultPoller",)
 
 
+class _PendingPoll:
+    """Event shared by the waiters of a message, plus the result that set it.
+
+    The result is handed to the waiters directly so they don't depend on it
+    still being stored when they resume.
+    """
+
+    __slots__ = ("event", "result")
+
+    def __init__(self) -> None:
+        self.event = Event()
+        self.result: PollingResult | None = None
+
+
 class DefaultPoller(Poller):
     """In-memory implementation of the Poller protocol.
 
     Suitable for single-server deployments or testing. For multi-server
     deployments, use a distributed poller implementation (e.g., DatabasePoller).
+
+    Results are kept in least-recently-pushed order and the oldest ones are
+    evicted once more than ``max_results`` are stored. Tasks already waiting
+    for a message still receive its result if it is evicted before they
+    resume.
+
+    The poller is bound to the event loop it is used from and is not
+    thread-safe. Code running in worker threads should push through that
+    loop, e.g. ``anyio.from_thread.run(poller.push, message_id)``.
     """
 
-    def __init__(self) -> None:
-        self.results: dict[str, PollingResult] = {}
-        self.events: dict[str, Event] = {}
+    def __init__(self, max_results: int = 10_000) -> None:
+        """Initialize the poller.
+
+        Args:
+            max_results: Maximum number of results to retain before evicting
+                the least recently pushed one; must be at least 1
+
+        Raises:
+            ValueError: If max_results is less than 1
+        """
+        if max_results < 1:
+            raise ValueError(f"max_results must be at least 1, got {max_results}")
+        self.max_results = max_results
+        self.results: OrderedDict[str, PollingResult] = OrderedDict()
+        self.events: dict[str, _PendingPoll] = {}
 
     async def poll(
         self,
         message_id: str,
-        exclude_statuses: list[PollingStatus] | None = None,
+        exclude_statuses: Collection[PollingStatus] | None = None,
     ) -> PollingResult:
-        # Check if result already exists
+        # Return the latest result once it matches the filter; otherwise wait
+        # for the next push on the event shared by all waiters of the message
         message = self.results.get(message_id)
-        if message and (not exclude_statuses or message.status not in exclude_statuses):
-            return message
+        while message is None or (exclude_statuses and message.status in exclude_statuses):
+            pending = self._pending_poll(message_id)
+            event = pending.event
+            try:
+                await event.wait()
+            finally:
+                # Drop the event if this was its last waiter (e.g. on timeout)
+                if not event.is_set() and not event.statistics().tasks_waiting:
+                    self._discard_pending_poll(message_id, pending)
 
-        # Create an event for this message_id if it doesn't exist
-        if message_id not in self.events:
-            self.events[message_id] = Event()
+            # Prefer a newer stored result; fall back to the one handed over
+            # by the push in case it was evicted before this task resumed
+            message = self.results.get(message_id, pending.result)
 
-        # Wait for the event to be set and check if it matches the filter
-        while True:
-            await self.events[message_id].wait()
-            message = self.results[message_id]
-            if not exclude_statuses or message.status not in exclude_statuses:
-                return message
-            # Reset the event to wait for the next update
-            self.events[message_id] = Event()
+        return message
 
     async def peek(
         self,
         message_id: str,
-        exclude_statuses: list[PollingStatus] | None = None,
+        exclude_statuses: Collection[PollingStatus] | None = None,
     ) -> PollingResult | None:
         """Check if a result exists without blocking."""
         message = self.results.get(message_id)
-        if message and exclude_statuses and message.status in exclude_statuses:
-            return None
-        return message
+        if message is None or exclude_statuses is None:
+            return message
+        return None if message.status in exclude_statuses else message
 
     async def push(
         self,
@@ -59,14 +97,52 @@ class DefaultPoller(Poller):
         data: dict[str, Any] | None = None,
         problem: ProblemDetails | None = None,
     ) -> None:
-        # Store the result
-        self.results[message_id] = PollingResult(
-            message_id=message_id,
-            status=status,
-            data=data,
-            problem=problem,
+        self._store(
+            PollingResult(
+                message_id=message_id,
+                status=status,
+                data=data,
+                problem=problem,
+            )
         )
 
-        # If there's a waiting event, trigger it
-        if message_id in self.events:
-            self.events[message_id].set()
+    async def push_many(self, results: Iterable[PollingResult]) -> None:
+        """Store several results at once.
+
+        Equivalent to pushing each result in turn, but without a separate
+        call per result; useful when many messages settle together.
+
+        Args:
+            results: The results to store
+        """
+        for result in results:
+            self._store(result)
+
+    def _store(self, result: PollingResult) -> None:
+        """Store a result and wake the tasks polling for it."""
+        message_id = result.message_id
+
+        # Store the result as the most recent one, evicting the oldest if full
+        self.results[message_id] = result
+        self.results.move_to_end(message_id)
+        if len(self.results) > self.max_results:
+            self.results.popitem(last=False)
+
+        # If there are waiters, hand them the result and wake them; push
+        # consumes the event so settled messages don't keep a set event around
+        pending = self.events.pop(message_id, None)
+        if pending is not None:
+            pending.result = result
+            pending.event.set()
+
+    def _pending_poll(self, message_id: str) -> _PendingPoll:
+        """Return the pending poll shared by a message's waiters, creating it if needed."""
+        pending = self.events.get(message_id)
+        if pending is None:
+            pending = self.events[message_id] = _PendingPoll()
+        return pending
+
+    def _discard_pending_poll(self, message_id: str, pending: _PendingPoll) -> None:
+        """Remove the pending poll for a message unless it was already replaced."""
+        if self.events.get(message_id) is pending:
+            del self.events[message_id]
@@ -82,9 +82,9 @@ class PollingPlugin(Plugin):
 
             # Add all custom acceptance events
             events_to_subscribe_to: list[type] = [
-                *list(self._accepted_events_map.keys()),
-                *list(self._successful_completion_events_map.keys()),
-                *list(self._failed_completion_events_map.keys()),
+                *self._accepted_events_map,
+                *self._successful_completion_events_map,
+                *self._failed_completion_events_map,
             ]
 
             # Register a startup hook to subscribe to all events
@@ -1,3 +1,4 @@
+from collections.abc import Collection
 from dataclasses import dataclass, field
 from typing import Any, Literal, Protocol
 
@@ -11,7 +12,7 @@ __all__ = (
 PollingStatus = Literal["accepted", "succeeded", "failed"]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ProblemDetails:
     """RFC 7807 Problem Details for HTTP APIs.
 
@@ -35,7 +36,7 @@ class ProblemDetails:
     extensions: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PollingResult:
     """Result of polling for a message completion.
 
@@ -71,12 +72,20 @@ class Poller(Protocol):
     """Protocol for polling message completion results.
 
     Implementations can be in-memory (DefaultPoller) or distributed (DatabasePoller).
+
+    Statuses to exclude may be given as any collection; callers on hot paths
+    can pass a module-level constant such as ``frozenset({"accepted"})``
+    instead of building a new list for every call.
+
+    Implementations are not required to keep results forever; they may evict
+    old results (e.g. by count or age). Callers should poll for a message soon
+    after sending it rather than rely on results being retained indefinitely.
     """
 
     async def poll(
         self,
         message_id: str,
-        exclude_statuses: list[PollingStatus] | None = None,
+        exclude_statuses: Collection[PollingStatus] | None = None,
     ) -> PollingResult:
         """Wait for and return the result of a message processing.
 
@@ -84,8 +93,8 @@ class Poller(Protocol):
 
         Args:
             message_id: The ID of the message to poll for
-            exclude_statuses: Optional list of statuses to exclude from results.
-                If the current status is in this list, poll will wait for an update.
+            exclude_statuses: Optional collection of statuses to exclude from results.
+                If the current status is in this collection, poll will wait for an update.
 
         Returns:
             The polling result
@@ -95,7 +104,7 @@ class Poller(Protocol):
     async def peek(
         self,
         message_id: str,
-        exclude_statuses: list[PollingStatus] | None = None,
+        exclude_statuses: Collection[PollingStatus] | None = None,
     ) -> PollingResult | None:
         """Check if a result exists without blocking.
 
@@ -104,8 +113,8 @@ class Poller(Protocol):
 
         Args:
             message_id: The ID of the message to check
-            exclude_statuses: Optional list of statuses to exclude from results.
-                If the current status is in this list, None is returned.
+            exclude_statuses: Optional collection of statuses to exclude from results.
+                If the current status is in this collection, None is returned.
 
         Returns:
             The polling result if available and not excluded, None otherwise
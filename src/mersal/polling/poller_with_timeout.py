@@ -1,6 +1,7 @@
+from collections.abc import Collection
 from typing import Any
 
-from anyio import fail_after
+from anyio import fail_after, move_on_after
 
 from mersal.exceptions import MersalExceptionError
 
@@ -17,28 +18,78 @@ class PollingTimeoutError(MersalExceptionError):
 
 
 class PollerWithTimeout(Poller):
-    """Wrapper that adds timeout support to any Poller implementation."""
+    """Wrapper that adds timeout support to any Poller implementation.
 
-    def __init__(self, poller: Poller) -> None:
+    With ``peek_first`` the wrapper peeks before polling and only arms the
+    timeout when the result isn't available yet. This pays off when peek is
+    a cheap in-memory lookup, as with DefaultPoller. For pollers backed by a
+    remote store it costs an extra round trip on every poll that has to
+    wait, so it is off by default.
+    """
+
+    def __init__(self, poller: Poller, *, peek_first: bool = False) -> None:
+        """Initialize the wrapper.
+
+        Args:
+            poller: The poller to add timeouts to
+            peek_first: Whether to peek for an available result before
+                arming the timeout; only worth it when peek is cheap
+        """
         self._poller = poller
+        self._peek_first = peek_first
 
     async def poll(
         self,
         message_id: str,
-        exclude_statuses: list[PollingStatus] | None = None,
+        exclude_statuses: Collection[PollingStatus] | None = None,
         *,
         timeout: float = 30,
     ) -> PollingResult:
+        # Only arm the timeout when the result isn't available yet
+        if self._peek_first and (result := await self._poller.peek(message_id, exclude_statuses)) is not None:
+            return result
+
         try:
             with fail_after(timeout):
                 return await self._poller.poll(message_id, exclude_statuses)
         except TimeoutError as e:
             raise PollingTimeoutError() from e
 
+    async def poll_or_none(
+        self,
+        message_id: str,
+        exclude_statuses: Collection[PollingStatus] | None = None,
+        *,
+        timeout: float = 0,
+    ) -> PollingResult | None:
+        """Return the result, waiting at most ``timeout`` seconds for it.
+
+        Unlike poll, a result that doesn't arrive in time yields None instead
+        of raising. This merges the peek-then-poll round trip of long-polling
+        endpoints into one call; with the default timeout it behaves like peek.
+        Like poll, it only peeks before waiting when ``peek_first`` is set.
+
+        Args:
+            message_id: The ID of the message to poll for
+            exclude_statuses: Optional collection of statuses to exclude from results
+            timeout: Seconds to wait for a matching result
+
+        Returns:
+            The polling result, or None if none matched within the timeout
+        """
+        if timeout <= 0:
+            return await self._poller.peek(message_id, exclude_statuses)
+        if self._peek_first and (result := await self._poller.peek(message_id, exclude_statuses)) is not None:
+            return result
+
+        with move_on_after(timeout):
+            return await self._poller.poll(message_id, exclude_statuses)
+        return None
+
     async def peek(
         self,
         message_id: str,
-        exclude_statuses: list[PollingStatus] | None = None,
+        exclude_statuses: Collection[PollingStatus] | None = None,
     ) -> PollingResult | None:
         """Delegate peek to underlying poller (no timeout needed for non-blocking operation)."""
         return await self._poller.peek(message_id, exclude_statuses)
@@ -3,11 +3,22 @@
 This module provides test doubles and utilities for testing code that uses polling.
 """
 
-from typing import Any
+from collections.abc import Collection
+from functools import partial
+from typing import Any, TypedDict
 
 from .poller import Poller, PollingResult, PollingStatus, ProblemDetails
 
-__all__ = ("PollerSpy", "PollerTestDouble")
+__all__ = ("PollerSpy", "PollerTestDouble", "PushCall")
+
+
+class PushCall(TypedDict):
+    """A push() call recorded by PollerTestDouble or PollerSpy."""
+
+    message_id: str
+    status: PollingStatus
+    data: dict[str, Any] | None
+    problem: ProblemDetails | None
 
 
 class PollerTestDouble(Poller):
@@ -71,14 +82,22 @@ class PollerTestDouble(Poller):
         >>> assert poller.last_poll_message_id == message_id
     """
 
-    def __init__(self) -> None:
+    def __init__(self, *, record_history: bool = True) -> None:
+        """Create a test double.
+
+        Args:
+            record_history: Whether to record every call in ``all_poll_calls``,
+                ``all_peek_calls`` and ``all_push_calls``. When False those lists
+                stay empty; counters, ``last_*`` attributes and
+                ``was_polled()``/``was_pushed()`` keep working.
+        """
+        self._record_history = record_history
+
         # Storage for stubbed results
         self._stubbed_results: dict[str, PollingResult] = {}
 
-        # Default behavior for unstubbed messages
-        self._default_status: PollingStatus | None = None
-        self._default_data: dict[str, Any] | None = None
-        self._default_problem: ProblemDetails | None = None
+        # Default behavior for unstubbed messages; builds a result for a message ID
+        self._default_factory: partial[PollingResult] | None = None
 
         # Spy counters
         self.poll_count: int = 0
@@ -88,12 +107,16 @@ class PollerTestDouble(Poller):
         # Last call tracking
         self.last_poll_message_id: str | None = None
         self.last_peek_message_id: str | None = None
-        self.last_push: dict[str, Any] | None = None
+        self.last_push: PushCall | None = None
 
         # All calls tracking
         self.all_poll_calls: list[str] = []
         self.all_peek_calls: list[str] = []
-        self.all_push_calls: list[dict[str, Any]] = []
+        self.all_push_calls: list[PushCall] = []
+
+        # Message IDs seen, for constant-time was_polled()/was_pushed()
+        self._polled_ids: set[str] = set()
+        self._pushed_ids: set[str] = set()
 
     def stub_result(
         self,
@@ -157,9 +180,7 @@ class PollerTestDouble(Poller):
         Args:
             data: Optional data to include in acceptance responses
         """
-        self._default_status = "accepted"
-        self._default_data = data
-        self._default_problem = None
+        self._default_factory = partial(PollingResult, status="accepted", data=data)
 
     def succeed_all(self, data: dict[str, Any] | None = None) -> None:
         """Configure the test double to succeed all messages by default.
@@ -170,9 +191,7 @@ class PollerTestDouble(Poller):
         Args:
             data: Optional data to include in success responses
         """
-        self._default_status = "succeeded"
-        self._default_data = data
-        self._default_problem = None
+        self._default_factory = partial(PollingResult, status="succeeded", data=data)
 
     def fail_all(self, problem: ProblemDetails | None = None) -> None:
         """Configure the test double to fail all messages by default.
@@ -183,20 +202,18 @@ class PollerTestDouble(Poller):
         Args:
             problem: Optional Problem Details to include in failure responses
         """
-        self._default_status = "failed"
-        self._default_data = None
-        self._default_problem = problem
+        self._default_factory = partial(PollingResult, status="failed", problem=problem)
 
     async def poll(
         self,
         message_id: str,
-        exclude_statuses: list[PollingStatus] | None = None,
+        exclude_statuses: Collection[PollingStatus] | None = None,
     ) -> PollingResult:
         """Return the stubbed result and record the call.
 
         Args:
             message_id: The message ID to poll for
-            exclude_statuses: Optional list of statuses to exclude from results
+            exclude_statuses: Optional collection of statuses to exclude from results
 
         Returns:
             The stubbed polling result
@@ -206,25 +223,21 @@ class PollerTestDouble(Poller):
         """
         self.poll_count += 1
         self.last_poll_message_id = message_id
-        self.all_poll_calls.append(message_id)
+        if self._record_history:
+            self.all_poll_calls.append(message_id)
+        self._polled_ids.add(message_id)
 
-        if message_id not in self._stubbed_results:
-            if self._default_status is None:
+        message = self._stubbed_results.get(message_id)
+        if message is None:
+            if self._default_factory is None:
                 raise KeyError(
                     f"No result stubbed for message {message_id}. "
                     f"Use stub_result(), stub_success()/stub_failure(), "
                     f"or accept_all()/succeed_all()/fail_all() to configure expected results."
                 )
-            message = PollingResult(
-                message_id=message_id,
-                status=self._default_status,
-                data=self._default_data,
-                problem=self._default_problem,
-            )
-        else:
-            message = self._stubbed_results[message_id]
+            message = self._default_factory(message_id=message_id)
 
-        if exclude_statuses and message.status in exclude_statuses:
+        if exclude_statuses is not None and message.status in exclude_statuses:
             raise KeyError(
                 f"Result for message {message_id} has status '{message.status}' "
                 f"which is in the excluded statuses list: {exclude_statuses}"
@@ -234,31 +247,27 @@ class PollerTestDouble(Poller):
     async def peek(
         self,
         message_id: str,
-        exclude_statuses: list[PollingStatus] | None = None,
+        exclude_statuses: Collection[PollingStatus] | None = None,
     ) -> PollingResult | None:
         """Return the stubbed result if available and record the call.
 
         Args:
             message_id: The message ID to check
-            exclude_statuses: Optional list of statuses to exclude from results
+            exclude_statuses: Optional collection of statuses to exclude from results
 
         Returns:
             The stubbed result if configured or default behavior is set, None otherwise
         """
         self.peek_count += 1
         self.last_peek_message_id = message_id
-        self.all_peek_calls.append(message_id)
+        if self._record_history:
+            self.all_peek_calls.append(message_id)
 
         message = self._stubbed_results.get(message_id)
-        if message is None and self._default_status is not None:
-            message = PollingResult(
-                message_id=message_id,
-                status=self._default_status,
-                data=self._default_data,
-                problem=self._default_problem,
-            )
+        if message is None and self._default_factory is not None:
+            message = self._default_factory(message_id=message_id)
 
-        if message and exclude_statuses and message.status in exclude_statuses:
+        if message is not None and exclude_statuses is not None and message.status in exclude_statuses:
             return None
         return message
 
@@ -278,24 +287,29 @@ class PollerTestDouble(Poller):
             problem: Optional Problem Details
         """
         self.push_count += 1
-        call_info = {
+        call_info: PushCall = {
             "message_id": message_id,
             "status": status,
             "data": data,
             "problem": problem,
         }
         self.last_push = call_info
-        self.all_push_calls.append(call_info)
+        if self._record_history:
+            self.all_push_calls.append(call_info)
+        self._pushed_ids.add(message_id)
 
         # Also store as a stubbed result so peek/poll can retrieve it
-        self.stub_result(message_id, status, data, problem)
+        self._stubbed_results[message_id] = PollingResult(
+            message_id=message_id,
+            status=status,
+            data=data,
+            problem=problem,
+        )
 
     def reset(self) -> None:
         """Reset all stubbed results, default behavior, and recorded calls."""
         self._stubbed_results.clear()
-        self._default_status = None
-        self._default_data = None
-        self._default_problem = None
+        self._default_factory = None
         self.poll_count = 0
         self.peek_count = 0
         self.push_count = 0
@@ -305,6 +319,8 @@ class PollerTestDouble(Poller):
         self.all_poll_calls.clear()
         self.all_peek_calls.clear()
         self.all_push_calls.clear()
+        self._polled_ids.clear()
+        self._pushed_ids.clear()
 
     def was_polled(self, message_id: str) -> bool:
         """Check if a specific message ID was polled.
@@ -315,7 +331,7 @@ class PollerTestDouble(Poller):
         Returns:
             True if the message was polled at least once
         """
-        return message_id in self.all_poll_calls
+        return message_id in self._polled_ids
 
     def was_pushed(self, message_id: str) -> bool:
         """Check if a result was pushed for a specific message ID.
@@ -326,7 +342,7 @@ class PollerTestDouble(Poller):
         Returns:
             True if a result was pushed for this message at least once
         """
-        return any(call["message_id"] == message_id for call in self.all_push_calls)
+        return message_id in self._pushed_ids
 
 
 class PollerSpy(Poller):
@@ -351,29 +367,34 @@ class PollerSpy(Poller):
         >>> result = await spy.poll(message_id)
     """
 
-    def __init__(self, wrapped: Poller) -> None:
+    def __init__(self, wrapped: Poller, *, record_history: bool = True) -> None:
         """Create a spy that wraps another poller.
 
         Args:
             wrapped: The poller to wrap and delegate to
+            record_history: Whether to record every call in ``all_push_calls``.
+                When False the list stays empty; ``push_count``, ``last_push``
+                and ``was_pushed()`` keep working.
         """
         self._wrapped = wrapped
+        self._record_history = record_history
 
         # Spy tracking for push calls only
         self.push_count: int = 0
-        self.last_push: dict[str, Any] | None = None
-        self.all_push_calls: list[dict[str, Any]] = []
+        self.last_push: PushCall | None = None
+        self.all_push_calls: list[PushCall] = []
+        self._pushed_ids: set[str] = set()
 
     async def poll(
         self,
         message_id: str,
-        exclude_statuses: list[PollingStatus] | None = None,
+        exclude_statuses: Collection[PollingStatus] | None = None,
     ) -> PollingResult:
         """Delegate to the wrapped poller.
 
         Args:
             message_id: The message ID to poll for
-            exclude_statuses: Optional list of statuses to exclude from results
+            exclude_statuses: Optional collection of statuses to exclude from results
 
         Returns:
             The polling result from the wrapped poller
@@ -383,13 +404,13 @@ class PollerSpy(Poller):
     async def peek(
         self,
         message_id: str,
-        exclude_statuses: list[PollingStatus] | None = None,
+        exclude_statuses: Collection[PollingStatus] | None = None,
     ) -> PollingResult | None:
         """Delegate to the wrapped poller.
 
         Args:
             message_id: The message ID to check
-            exclude_statuses: Optional list of statuses to exclude from results
+            exclude_statuses: Optional collection of statuses to exclude from results
 
         Returns:
             The result from the wrapped poller
@@ -413,14 +434,16 @@ class PollerSpy(Poller):
         """
         # Record the call
         self.push_count += 1
-        call_info = {
+        call_info: PushCall = {
             "message_id": message_id,
             "status": status,
             "data": data,
             "problem": problem,
         }
         self.last_push = call_info
-        self.all_push_calls.append(call_info)
+        if self._record_history:
+            self.all_push_calls.append(call_info)
+        self._pushed_ids.add(message_id)
 
         # Delegate to wrapped poller
         await self._wrapped.push(message_id, status, data, problem)
@@ -434,10 +457,11 @@ class PollerSpy(Poller):
         Returns:
             True if a result was pushed for this message at least once
         """
-        return any(call["message_id"] == message_id for call in self.all_push_calls)
+        return message_id in self._pushed_ids
 
     def reset(self) -> None:
         """Reset all recorded push calls."""
         self.push_count = 0
         self.last_push = None
         self.all_push_calls.clear()
+        self._pushed_ids.clear()
@@ -0,0 +1,180 @@
+from typing import Any
+from unittest import mock
+
+import anyio
+import pytest
+
+from mersal.polling import DefaultPoller, PollerWithTimeout, PollingResult, PollingTimeoutError
+
+__all__ = ("TestDefaultPoller",)
+
+
+pytestmark = pytest.mark.anyio
+
+
+class TestDefaultPoller:
+    async def test_evicts_least_recently_pushed_results(self):
+        poller = DefaultPoller(max_results=2)
+
+        await poller.push("1")
+        await poller.push("2")
+        await poller.push("1", status="failed")
+        await poller.push("3")
+
+        assert list(poller.results) == ["1", "3"]
+        assert await poller.peek("2") is None
+        result = await poller.peek("1")
+        assert result
+        assert result.is_failure
+
+    async def test_rejects_non_positive_max_results(self):
+        with pytest.raises(ValueError):
+            DefaultPoller(max_results=0)
+
+    async def test_waiter_receives_result_evicted_before_it_resumes(self):
+        poller = DefaultPoller(max_results=1)
+        results: list[PollingResult] = []
+
+        async def poll() -> None:
+            results.append(await poller.poll("1"))
+
+        with anyio.fail_after(1):
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(poll)
+                await anyio.wait_all_tasks_blocked()
+                await poller.push_many([PollingResult(message_id="1"), PollingResult(message_id="2")])
+
+        assert list(poller.results) == ["2"]
+        assert [result.message_id for result in results] == ["1"]
+
+    async def test_waiter_receives_result_evicted_by_later_push(self):
+        poller = DefaultPoller(max_results=1)
+        results: list[PollingResult] = []
+
+        async def poll() -> None:
+            results.append(await poller.poll("1"))
+
+        with anyio.fail_after(1):
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(poll)
+                await anyio.wait_all_tasks_blocked()
+                # Neither push yields, so "1" is evicted before the waiter resumes
+                await poller.push("1")
+                await poller.push("2")
+
+        assert [result.message_id for result in results] == ["1"]
+
+    async def test_methods_can_be_patched(self):
+        poller = DefaultPoller()
+
+        with mock.patch.object(poller, "push", mock.AsyncMock()) as push:
+            await poller.push("1")
+
+        push.assert_awaited_once_with("1")
+        assert poller.results == {}
+
+    async def test_poller_with_timeout_methods_can_be_patched(self):
+        poller_with_timeout = PollerWithTimeout(DefaultPoller())
+
+        with mock.patch.object(poller_with_timeout, "poll", mock.AsyncMock()) as poll:
+            await poller_with_timeout.poll("1")
+
+        poll.assert_awaited_once_with("1")
+
+    async def test_unknown_excluded_statuses_are_ignored(self):
+        poller = DefaultPoller()
+        await poller.push("1")
+        exclude_statuses: list[Any] = ["bogus"]
+
+        with anyio.fail_after(1):
+            result = await poller.poll("1", exclude_statuses=exclude_statuses)
+
+        assert result.is_success
+        assert await poller.peek("1", exclude_statuses=exclude_statuses) == result
+
+    async def test_push_releases_event(self):
+        poller = DefaultPoller()
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(poller.poll, "1")
+            await anyio.wait_all_tasks_blocked()
+            assert "1" in poller.events
+            await poller.push("1")
+
+        assert poller.events == {}
+
+    async def test_timed_out_poll_releases_event(self):
+        poller = DefaultPoller()
+
+        with pytest.raises(PollingTimeoutError):
+            await PollerWithTimeout(poller).poll("1", timeout=0.01)
+
+        assert poller.events == {}
+
+    async def test_all_waiters_receive_update_after_excluded_status(self):
+        poller = DefaultPoller()
+        results: list[PollingResult] = []
+
+        async def poll() -> None:
+            results.append(await poller.poll("1", exclude_statuses=["accepted"]))
+
+        with anyio.fail_after(1):
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(poll)
+                tg.start_soon(poll)
+                await anyio.wait_all_tasks_blocked()
+                await poller.push("1", status="accepted")
+                await anyio.wait_all_tasks_blocked()
+                await poller.push("1")
+
+        assert [result.status for result in results] == ["succeeded", "succeeded"]
+
+    async def test_poll_with_timeout_returns_available_result(self):
+        poller = DefaultPoller()
+        await poller.push("1")
+
+        result = await PollerWithTimeout(poller, peek_first=True).poll("1", timeout=0)
+
+        assert result.is_success
+
+    async def test_push_many(self):
+        poller = DefaultPoller()
+        results: list[PollingResult] = []
+
+        async def poll(message_id: str) -> None:
+            results.append(await poller.poll(message_id))
+
+        with anyio.fail_after(1):
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(poll, "1")
+                tg.start_soon(poll, "2")
+                await anyio.wait_all_tasks_blocked()
+                await poller.push_many(
+                    [
+                        PollingResult(message_id="1"),
+                        PollingResult(message_id="2", status="failed"),
+                    ]
+                )
+
+        assert sorted((result.message_id, result.status) for result in results) == [
+            ("1", "succeeded"),
+            ("2", "failed"),
+        ]
+
+    async def test_poll_or_none(self):
+        poller = DefaultPoller()
+        poller_with_timeout = PollerWithTimeout(poller)
+
+        assert await poller_with_timeout.poll_or_none("1") is None
+        assert await poller_with_timeout.poll_or_none("1", timeout=0.01) is None
+        assert poller.events == {}
+
+        await poller.push("1", status="accepted")
+        assert await poller_with_timeout.poll_or_none("1", exclude_statuses=["accepted"], timeout=0.01) is None
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(poller.push, "1")
+            result = await poller_with_timeout.poll_or_none("1", exclude_statuses=["accepted"], timeout=1)
+
+        assert result
+        assert result.is_success
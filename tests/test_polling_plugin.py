@@ -1,4 +1,5 @@
 import uuid
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
 
@@ -38,6 +39,7 @@ __all__ = (
     "Message1FailedToComplete",
     "MessageHandler",
     "MessageHandlerThatPublishes",
+    "MessageHandlerThatSignals",
     "SlowHandler",
     "TestPollingPlugin",
     "ThrowingMessageHandler",
@@ -55,37 +57,39 @@ class Message2:
     pass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Message1CompletedSuccessfully:
     pass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Message2CompletedSuccessfully:
     pass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Message1FailedToComplete:
     pass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Message2FailedToComplete:
     pass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Message1Accepted:
     pass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Message2Accepted:
     pass
 
 
 class MessageHandler:
+    __slots__ = ("calls",)
+
     def __init__(self) -> None:
         self.calls = 0
 
@@ -94,7 +98,9 @@ class MessageHandler:
 
 
 class SlowHandler:
-    def __init__(self, delay: int) -> None:
+    __slots__ = ("calls", "delay")
+
+    def __init__(self, delay: float) -> None:
         self.calls = 0
         self.delay = delay
 
@@ -103,16 +109,38 @@ class SlowHandler:
         await anyio.sleep(self.delay)
 
 
+class MessageHandlerThatSignals(MessageHandlerThatCounts):
+    """Counts messages and lets the test wait until enough were handled."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._handled = anyio.Event()
+
+    async def __call__(self, message: Any):
+        await super().__call__(message)
+        self._handled.set()
+        self._handled = anyio.Event()
+
+    async def wait_for_count(self, count: int) -> None:
+        with anyio.fail_after(5):
+            while self.count < count:
+                await self._handled.wait()
+
+
 class HandlerError(Exception):
     """Custom error."""
 
 
 class ThrowingMessageHandler:
+    __slots__ = ()
+
     async def __call__(self, message: Any):
         raise HandlerError()
 
 
 class MessageHandlerThatPublishes:
+    __slots__ = ("app", "calls", "message_context", "published_message")
+
     def __init__(self, message_context: MessageContext, app: Mersal, published_message: Any) -> None:
         self.calls = 0
         self.app = app
@@ -124,6 +152,57 @@ class MessageHandlerThatPublishes:
         await self.app.publish(self.published_message)
 
 
+def _constant_factory(handler: Any) -> Callable[[MessageContext, Mersal], Any]:
+    """Handler factory for the activator that always returns the given handler."""
+    return lambda *_: handler
+
+
+def _failed_completion(name: str, status: int) -> FailedCompletionCorrelation:
+    return FailedCompletionCorrelation(
+        problem_builder=lambda event: ProblemDetails(
+            type=f"https://api.example.com/problems/{name.lower()}-failed",
+            title=f"{name} Failed",
+            status=status,
+            detail=f"{name} failed to complete",
+        )
+    )
+
+
+def _custom_event_polling_config(
+    poller: DefaultPoller, completion_kind: str
+) -> tuple[PollingConfig, tuple[type, type]]:
+    """Build a polling config correlating one custom event per message for the given kind."""
+    exclude_from_completion_events: set[type] = {Message1, Message2}
+    if completion_kind == "success":
+        return PollingConfig(
+            poller,
+            successful_completion_events_map={
+                Message1CompletedSuccessfully: SuccessfulCompletionCorrelation(),
+                Message2CompletedSuccessfully: SuccessfulCompletionCorrelation(),
+            },
+            exclude_from_completion_events=exclude_from_completion_events,
+        ), (Message1CompletedSuccessfully, Message2CompletedSuccessfully)
+    if completion_kind == "failure":
+        return PollingConfig(
+            poller,
+            failed_completion_events_map={
+                Message1FailedToComplete: _failed_completion("Message1", 400),
+                Message2FailedToComplete: _failed_completion("Message2", 422),
+            },
+            exclude_from_completion_events=exclude_from_completion_events,
+        ), (Message1FailedToComplete, Message2FailedToComplete)
+    if completion_kind == "accepted":
+        return PollingConfig(
+            poller,
+            accepted_events_map={
+                Message1Accepted: AcceptedCorrelation(),
+                Message2Accepted: AcceptedCorrelation(),
+            },
+            exclude_from_completion_events=exclude_from_completion_events,
+        ), (Message1Accepted, Message2Accepted)
+    raise ValueError(f"Unknown completion kind: {completion_kind}")
+
+
 class TestPollingPlugin:
     async def test_polling(
         self,
@@ -134,10 +213,10 @@ class TestPollingPlugin:
         activator = BuiltinHandlerActivator()
         poller = DefaultPoller()
         message_handler = MessageHandlerThatCounts()
-        completion_event_handler = MessageHandlerThatCounts()
-        activator.register(Message1, lambda __, _: message_handler)
-        activator.register(MessageCompletedEvent, lambda _, __: completion_event_handler)
-        message1_id = uuid.uuid4()
+        completion_event_handler = MessageHandlerThatSignals()
+        activator.register(Message1, _constant_factory(message_handler))
+        activator.register(MessageCompletedEvent, _constant_factory(completion_event_handler))
+        message1_id = uuid.UUID(int=1)
 
         app = Mersal(
             "m1",
@@ -155,14 +234,12 @@ class TestPollingPlugin:
         )
         await app.start()
 
-        await anyio.sleep(0.5)
-
         await app.send_local(
             Message1(),
             headers={"message_id": message1_id, REPLY_TO_HEADER: app.transport.address},
         )
 
-        await anyio.sleep(0.5)
+        await completion_event_handler.wait_for_count(1)
 
         assert message_handler.count == 1
         assert completion_event_handler.count == 1
@@ -175,9 +252,9 @@ class TestPollingPlugin:
 
         await app.send_local(
             Message1(),
-            headers={"message_id": uuid.uuid4(), REPLY_TO_HEADER: app.transport.address},
+            headers={"message_id": uuid.UUID(int=2), REPLY_TO_HEADER: app.transport.address},
         )
-        await anyio.sleep(0.5)
+        await completion_event_handler.wait_for_count(2)
         assert message_handler.count == 2
         assert completion_event_handler.count == 2
 
@@ -195,7 +272,7 @@ class TestPollingPlugin:
         activator = BuiltinHandlerActivator()
         poller = DefaultPoller()
         activator.register(Message1, lambda __, _: MessageHandler())
-        message1_id = uuid.uuid4()
+        message1_id = uuid.UUID(int=1)
 
         app = Mersal(
             "m1",
@@ -212,7 +289,6 @@ class TestPollingPlugin:
             ],
         )
         await app.start()
-        await anyio.sleep(0.1)
 
         await app.send_local(
             Message1(),
@@ -221,7 +297,6 @@ class TestPollingPlugin:
                 REPLY_TO_HEADER: app.transport.address,
             },
         )
-        await anyio.sleep(0.5)
 
         result = await poller.poll(str(message1_id))
         assert result
@@ -229,14 +304,26 @@ class TestPollingPlugin:
 
         await app.stop()
 
-    async def test_polling_with_custom_success_completion_event(
+    @pytest.mark.parametrize(
+        ("completion_kind", "expected_attr", "expected_problems"),
+        [
+            ("success", "is_success", [None, None]),
+            ("failure", "is_failure", [(400, "Message1 Failed"), (422, "Message2 Failed")]),
+            ("accepted", "is_accepted", [None, None]),
+        ],
+    )
+    async def test_polling_with_custom_event(
         self,
+        completion_kind: str,
+        expected_attr: str,
+        expected_problems: list[tuple[int, str] | None],
         in_memory_transport: InMemoryTransport,
         in_memory_subscription_storage: InMemorySubscriptionStorage,
         serializer: Serializer,
     ):
         activator = BuiltinHandlerActivator()
         poller = DefaultPoller()
+        polling_config, (message1_event, message2_event) = _custom_event_polling_config(poller, completion_kind)
         app = Mersal(
             "m1",
             activator,
@@ -244,117 +331,33 @@ class TestPollingPlugin:
             serializer=serializer,
             subscription_storage=in_memory_subscription_storage,
             autosubscribe=AutosubscribeConfig(set()),
-            plugins=[
-                PollingConfig(
-                    poller,
-                    successful_completion_events_map={
-                        Message1CompletedSuccessfully: SuccessfulCompletionCorrelation(),
-                        Message2CompletedSuccessfully: SuccessfulCompletionCorrelation(),
-                    },
-                    exclude_from_completion_events={
-                        Message1,
-                        Message2,
-                    },
-                ).plugin
-            ],
+            plugins=[polling_config.plugin],
         )
         activator.register(
             Message1,
-            lambda m, b: MessageHandlerThatPublishes(m, b, Message1CompletedSuccessfully()),
+            lambda m, b: MessageHandlerThatPublishes(m, b, message1_event()),
         )
         activator.register(
             Message2,
-            lambda m, b: MessageHandlerThatPublishes(m, b, Message2CompletedSuccessfully()),
+            lambda m, b: MessageHandlerThatPublishes(m, b, message2_event()),
         )
-        message1_id = uuid.uuid4()
-        message2_id = uuid.uuid4()
+        message1_id = uuid.UUID(int=1)
+        message2_id = uuid.UUID(int=2)
         await app.start()
 
-        await app.send_local(Message1(), headers={"message_id": message1_id})
-        await app.send_local(Message2(), headers={"message_id": message2_id})
-        await anyio.sleep(0.5)
-        result1 = await poller.poll(str(message1_id))
-        result2 = await poller.poll(str(message2_id))
-        assert result1
-        assert result1.is_success
-        assert result2
-        assert result2.is_success
-
-        await app.stop()
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(app.send_local, Message1(), {"message_id": message1_id})
+            tg.start_soon(app.send_local, Message2(), {"message_id": message2_id})
 
-    async def test_polling_with_custom_failure_completion_event(
-        self,
-        in_memory_transport: InMemoryTransport,
-        in_memory_subscription_storage: InMemorySubscriptionStorage,
-        serializer: Serializer,
-    ):
-        activator = BuiltinHandlerActivator()
-        poller = DefaultPoller()
-        app = Mersal(
-            "m1",
-            activator,
-            transport=in_memory_transport,
-            serializer=serializer,
-            subscription_storage=in_memory_subscription_storage,
-            autosubscribe=AutosubscribeConfig(set()),
-            plugins=[
-                PollingConfig(
-                    poller,
-                    failed_completion_events_map={
-                        Message1FailedToComplete: FailedCompletionCorrelation(
-                            problem_builder=lambda event: ProblemDetails(
-                                type="https://api.example.com/problems/message1-failed",
-                                title="Message1 Failed",
-                                status=400,
-                                detail="Message1 failed to complete",
-                            )
-                        ),
-                        Message2FailedToComplete: FailedCompletionCorrelation(
-                            problem_builder=lambda event: ProblemDetails(
-                                type="https://api.example.com/problems/message2-failed",
-                                title="Message2 Failed",
-                                status=422,
-                                detail="Message2 failed to complete",
-                            )
-                        ),
-                    },
-                    exclude_from_completion_events={
-                        Message1,
-                        Message2,
-                    },
-                ).plugin
-            ],
-        )
-        activator.register(
-            Message1,
-            lambda m, b: MessageHandlerThatPublishes(m, b, Message1FailedToComplete()),
-        )
-        activator.register(
-            Message2,
-            lambda m, b: MessageHandlerThatPublishes(m, b, Message2FailedToComplete()),
-        )
-        message1_id = uuid.uuid4()
-        message2_id = uuid.uuid4()
-        await app.start()
-
-        await app.send_local(Message1(), headers={"message_id": message1_id})
-        await app.send_local(Message2(), headers={"message_id": message2_id})
-        await anyio.sleep(0.5)
-
-        result1 = await poller.poll(str(message1_id))
-        result2 = await poller.poll(str(message2_id))
-
-        assert result1
-        assert result1.is_failure
-        assert result1.problem is not None
-        assert result1.problem.status == 400
-        assert result1.problem.title == "Message1 Failed"
+        results = [
+            await poller.poll(str(message1_id)),
+            await poller.poll(str(message2_id)),
+        ]
 
-        assert result2
-        assert result2.is_failure
-        assert result2.problem is not None
-        assert result2.problem.status == 422
-        assert result2.problem.title == "Message2 Failed"
+        assert all(getattr(result, expected_attr) for result in results)
+        assert [
+            (result.problem.status, result.problem.title) if result.problem else None for result in results
+        ] == expected_problems
 
         await app.stop()
 
@@ -377,12 +380,11 @@ class TestPollingPlugin:
         )
 
         handler = ThrowingMessageHandler()
-        activator.register(Message1, lambda __, _: handler)
-        message_id = uuid.uuid4()
+        activator.register(Message1, _constant_factory(handler))
+        message_id = uuid.UUID(int=1)
         await app.start()
 
         await app.send_local(Message1(), headers={"message_id": message_id})
-        await anyio.sleep(0.1)
         result = await poller.poll(str(message_id))
         assert result
         assert result.is_failure
@@ -398,8 +400,7 @@ class TestPollingPlugin:
         serializer: Serializer,
     ):
         activator = BuiltinHandlerActivator()
-        _poller = DefaultPoller()
-        poller = PollerWithTimeout(_poller)
+        poller = DefaultPoller()
         app = Mersal(
             "m1",
             activator,
@@ -407,17 +408,17 @@ class TestPollingPlugin:
             serializer=serializer,
             subscription_storage=in_memory_subscription_storage,
             autosubscribe=AutosubscribeConfig(set()),
-            plugins=[PollingConfig(_poller).plugin],
+            plugins=[PollingConfig(poller).plugin],
         )
 
-        handler = SlowHandler(1)
-        activator.register(Message1, lambda __, _: handler)
-        message_id = uuid.uuid4()
+        handler = SlowHandler(0.2)
+        activator.register(Message1, _constant_factory(handler))
+        message_id = uuid.UUID(int=1)
         await app.start()
 
         await app.send_local(Message1(), headers={"message_id": message_id})
-        with pytest.raises(PollingTimeoutError):
-            await poller.poll(str(message_id), timeout=0.5)
+        with pytest.raises(TimeoutError), anyio.fail_after(0.05):
+            await poller.poll(str(message_id))
 
         await app.stop()
 
@@ -431,10 +432,10 @@ class TestPollingPlugin:
         message = Message1()
 
         completion_event_handler = MessageHandlerThatCounts()
-        activator.register(MessageCompletedEvent, lambda _, __: completion_event_handler)
+        activator.register(MessageCompletedEvent, _constant_factory(completion_event_handler))
 
-        message_handler = MessageHandlerThatCounts()
-        activator.register(Message1, lambda m, b: message_handler)
+        message_handler = MessageHandlerThatSignals()
+        activator.register(Message1, _constant_factory(message_handler))
 
         poller = DefaultPoller()
 
@@ -452,15 +453,18 @@ class TestPollingPlugin:
             transport=in_memory_transport,
             serializer=serializer,
             subscription_storage=in_memory_subscription_storage,
+            autosubscribe=AutosubscribeConfig(set()),
             plugins=plugins,
         )
 
         await app.start()
 
-        message_id = uuid.uuid4()
-        await app.send_local(message, headers={"message_id": message_id})
+        message_id = uuid.UUID(int=1)
+        # Completion events are only sent to a reply-to address, so without
+        # one the exclusion would go untested
+        await app.send_local(message, headers={"message_id": message_id, REPLY_TO_HEADER: app.transport.address})
 
-        await anyio.sleep(0.1)
+        await message_handler.wait_for_count(1)
         await app.stop()
 
         assert message_handler.count == 1
@@ -511,13 +515,13 @@ class TestPollingPlugin:
             Message2,
             lambda m, b: MessageHandlerThatPublishes(m, b, Message2Accepted()),
         )
-        message1_id = uuid.uuid4()
-        message2_id = uuid.uuid4()
+        message1_id = uuid.UUID(int=1)
+        message2_id = uuid.UUID(int=2)
         await app.start()
 
-        await app.send_local(Message1(), headers={"message_id": message1_id})
-        await app.send_local(Message2(), headers={"message_id": message2_id})
-        await anyio.sleep(0.5)
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(app.send_local, Message1(), {"message_id": message1_id})
+            tg.start_soon(app.send_local, Message2(), {"message_id": message2_id})
 
         # Poll for accepted state
         result1 = await poller.poll(str(message1_id))
@@ -538,11 +542,10 @@ class TestPollingPlugin:
         # Now publish completion events to transition to completed state
         await app.publish(Message1CompletedSuccessfully(), headers={"correlation_id": message1_id})
         await app.publish(Message2CompletedSuccessfully(), headers={"correlation_id": message2_id})
-        await anyio.sleep(0.5)
 
-        # Poll again to verify they're now completed
-        result1_completed = await poller.poll(str(message1_id))
-        result2_completed = await poller.poll(str(message2_id))
+        # Poll again, waiting for them to move past the accepted state
+        result1_completed = await poller.poll(str(message1_id), exclude_statuses=["accepted"])
+        result2_completed = await poller.poll(str(message2_id), exclude_statuses=["accepted"])
 
         assert result1_completed
         assert result1_completed.is_success
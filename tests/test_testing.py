@@ -0,0 +1,113 @@
+from unittest import mock
+
+import pytest
+
+from mersal.polling import DefaultPoller, ProblemDetails
+from mersal.polling.testing import PollerSpy, PollerTestDouble
+
+__all__ = (
+    "TestPollerSpy",
+    "TestPollerTestDouble",
+)
+
+
+pytestmark = pytest.mark.anyio
+
+
+class TestPollerTestDouble:
+    async def test_records_calls(self):
+        poller = PollerTestDouble()
+        poller.succeed_all()
+
+        await poller.push("1", data={"result": "ok"})
+        await poller.poll("1")
+        await poller.peek("2")
+
+        assert poller.all_push_calls == [
+            {"message_id": "1", "status": "succeeded", "data": {"result": "ok"}, "problem": None}
+        ]
+        assert poller.all_poll_calls == ["1"]
+        assert poller.all_peek_calls == ["2"]
+        assert poller.was_pushed("1")
+        assert poller.was_polled("1")
+        assert not poller.was_polled("2")
+
+    async def test_without_history(self):
+        poller = PollerTestDouble(record_history=False)
+        poller.succeed_all()
+
+        await poller.push("1", data={"result": "ok"})
+        await poller.poll("1")
+        await poller.peek("2")
+
+        assert poller.all_push_calls == []
+        assert poller.all_poll_calls == []
+        assert poller.all_peek_calls == []
+        assert (poller.push_count, poller.poll_count, poller.peek_count) == (1, 1, 1)
+        assert poller.last_push
+        assert poller.last_push["data"] == {"result": "ok"}
+        assert poller.was_pushed("1")
+        assert poller.was_polled("1")
+
+    async def test_default_behavior(self):
+        poller = PollerTestDouble()
+        problem = ProblemDetails(type="about:blank", title="Failed", status=400)
+
+        poller.fail_all(problem)
+        result = await poller.poll("1")
+        assert result.message_id == "1"
+        assert result.is_failure
+        assert result.problem is problem
+
+        poller.accept_all(data={"step": 1})
+        result = await poller.poll("2")
+        assert result.is_accepted
+        assert result.data == {"step": 1}
+
+        poller.reset()
+        assert await poller.peek("3") is None
+        with pytest.raises(KeyError):
+            await poller.poll("3")
+
+    async def test_methods_can_be_patched(self):
+        poller = PollerTestDouble()
+
+        with mock.patch.object(poller, "poll", mock.AsyncMock()) as poll:
+            await poller.poll("1")
+
+        poll.assert_awaited_once_with("1")
+
+
+class TestPollerSpy:
+    async def test_delegates_and_records_pushes(self):
+        poller = DefaultPoller()
+        spy = PollerSpy(poller)
+
+        await spy.push("1", data={"result": "ok"})
+
+        assert spy.push_count == 1
+        assert spy.all_push_calls == [
+            {"message_id": "1", "status": "succeeded", "data": {"result": "ok"}, "problem": None}
+        ]
+        assert spy.was_pushed("1")
+        result = await spy.poll("1")
+        assert result.data == {"result": "ok"}
+
+    async def test_without_history(self):
+        spy = PollerSpy(DefaultPoller(), record_history=False)
+
+        await spy.push("1")
+
+        assert spy.all_push_calls == []
+        assert spy.push_count == 1
+        assert spy.last_push
+        assert spy.last_push["message_id"] == "1"
+        assert spy.was_pushed("1")
+
+    async def test_methods_can_be_patched(self):
+        spy = PollerSpy(DefaultPoller())
+
+        with mock.patch.object(spy, "push", mock.AsyncMock()) as push:
+            await spy.push("1")
+
+        push.assert_awaited_once_with("1")